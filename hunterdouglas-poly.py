@@ -19,8 +19,14 @@ import udi_interface
 
 LOGGER = udi_interface.LOGGER
 
-VERSION = '1.12.4'
+VERSION = '1.12.5'
 """
+1.12.5
+DONE scene data lookup by id using controller scenes_map
+DONE gateway events indexed by (evt, id) on the controller
+DONE shade data lookup by id using controller shades_map
+DONE shade position commands within 0.1s merged into one gateway put
+
 1.12.4
 DEBUG Gen-2 make a default capability if none exists in JSON
 
@@ -84,5 +90,5 @@ if __name__ == "__main__":
         """
         polyglot.stop()
     except Exception as err:
-        LOGGER.error('Excption: {0}'.format(err), exc_info=True)
+        LOGGER.error('Excption: %s', err, exc_info=True)
     sys.exit(0)
@@ -12,6 +12,8 @@ import base64
 import time
 import socket
 import json
+import threading
+from collections import deque, Counter
 
 # external libraries
 import udi_interface
@@ -52,6 +54,10 @@ URL_SCENES_ACTIVE = 'http://{g}/home/scenes/active'
 URL_EVENTS = 'http://{g}/home/events'
 URL_EVENTS_SCENES = 'http://{g}/home/scenes/events'
 URL_EVENTS_SHADES = 'http://{g}/home/shades/events'
+# PowerView G3 shade position keys, reported by the gateway as fractions
+G3_POSITION_KEYS = ('primary', 'secondary', 'tilt', 'velocity')
+# shade events where only the latest one per shade matters
+COALESCE_EVENTS = frozenset({'motion-started', 'motion-stopped', 'shade-online', 'shade-offline'})
 
 """
 HunterDouglas PowerView G2 url's
@@ -87,25 +93,28 @@ class Controller(udi_interface.Node):
         self.address = address
         self.name = name
         self.n_queue = []
+        self.n_queue_cond = threading.Condition()
         self.last = 0.0
         self.no_update = False
         self.discovery = False
         self.gateway = URL_DEFAULT_GATEWAY
         self.gateway_array = []
-        self.gateway_event = [{'evt': 'home', 'shades': [], 'scenes': []}]
+        self.event_lock = threading.Lock()
+        self.resetEvents()
         self.rooms_array = []
         self.roomIds_array = []
         self.shades_array = []
         self.shadeIds_array = []
+        self.shades_map = {}
+        self.shades_version = 0 # bumped on each home update, shades skip re-reading an unchanged map
         self.scenes_array = []
         self.sceneIds_array = []
+        self.scenes_map = {}
+        self.sceneIdsActive_array = set()
         self.generation = 99 # start with unknown
         self.eventTimeout = 720
         self.eventTimer = 0
 
-        self.tiltCapable = [1, 2, 4, 5, 9, 10]
-        self.tiltOnly90Capable = [1, 9]
-
         # Create data storage classes to hold specific data that we need
         # to interact with.  
         self.Parameters = Custom(polyglot, 'customparams')
@@ -142,12 +151,14 @@ class Controller(udi_interface.Node):
         until it is fully created before we try to use it.
         '''
     def node_queue(self, data):
-        self.n_queue.append(data['address'])
+        with self.n_queue_cond:
+            self.n_queue.append(data['address'])
+            self.n_queue_cond.notify()
 
     def wait_for_node_done(self):
-        while len(self.n_queue) == 0:
-            time.sleep(0.2)
-        self.n_queue.pop()
+        with self.n_queue_cond:
+            self.n_queue_cond.wait_for(lambda: len(self.n_queue) > 0)
+            self.n_queue.pop()
 
     def start(self):
         self.Notices['hello'] = 'Start-up'
@@ -229,7 +240,7 @@ class Controller(udi_interface.Node):
     Called via the LOGLEVEL event.
     """
     def handleLevelChange(self, level):
-        LOGGER.info('New log level: {}'.format(level))
+        LOGGER.info('New log level: %s', level)
 
     def checkParams(self):
         """
@@ -240,7 +251,7 @@ class Controller(udi_interface.Node):
         self.gateway = self.Parameters.gatewayip
         if self.gateway is None:
             self.gateway = URL_DEFAULT_GATEWAY
-            LOGGER.warn('checkParams: gateway not defined in customParams, using {}'.format(URL_DEFAULT_GATEWAY))
+            LOGGER.warn('checkParams: gateway not defined in customParams, using %s', URL_DEFAULT_GATEWAY)
             self.Notices['gateway'] = 'Please note using default gateway address'
             return (gatewaycheck != self.gateway)
         try:
@@ -261,7 +272,7 @@ class Controller(udi_interface.Node):
             self.Notices.delete('notPrimary')
             return (gatewaycheck != self.gateway)
         else:
-            LOGGER.warn(f"checkParams: no gateway found in {self.gateway_array}")
+            LOGGER.warn('checkParams: no gateway found in %s', self.gateway_array)
             self.Notices['gateway'] = 'Please note no primary gateway found in gatewayip'
             return False
                                 
@@ -280,10 +291,10 @@ class Controller(udi_interface.Node):
         for ip in self.gateway_array:
             res = self.get(URL_GATEWAY.format(g=ip))
             if res.status_code == requests.codes.ok:
-                LOGGER.info(f"{ip} is PowerView G3")
+                LOGGER.info('%s is PowerView G3', ip)
                 res = self.get(URL_HOME.format(g=ip))
                 if res.status_code == requests.codes.ok:
-                    LOGGER.info(f"{ip} is PowerView G3 Primary")
+                    LOGGER.info('%s is PowerView G3 Primary', ip)
                     self.gateway = ip
                     self.generation = 3
                     return True
@@ -293,7 +304,7 @@ class Controller(udi_interface.Node):
         for ip in self.gateway_array:
             res = self.get(URL_G2_HUB.format(g=ip))
             if res.status_code == requests.codes.ok:
-                LOGGER.info(f"{ip} is PowerView 2")
+                LOGGER.info('%s is PowerView 2', ip)
                 self.gateway = ip
                 self.generation = 2
                 return True
@@ -313,73 +324,71 @@ class Controller(udi_interface.Node):
         # pause updates when in discovery
         if self.discovery == True:
             return
-        if 'longPoll' in flag:
+        if flag == 'longPoll':
             LOGGER.debug('longPoll re-parse updateallfromserver (controller)')
             self.updateAllFromServer()
             try:
-                event = list(filter(lambda events: events['evt'] == 'homedoc-updated', self.gateway_event))
+                event = self.getEvent('homedoc-updated')
                 if event:
-                    event = event[0]
-                    LOGGER.warn('longPoll event - homedoc-updated - {}'.format(event))
-                    self.gateway_event.remove(event)
+                    LOGGER.warn('longPoll event - homedoc-updated - %s', event)
+                    self.removeEvent(event)
                 
-                event = list(filter(lambda events: events['evt'] == 'home', self.gateway_event))
+                event = self.getEvent('home')
                 if event:
-                    event = event[0]
-                    self.gateway_event[self.gateway_event.index(event)]['shades'] = self.shadeIds_array
-                    self.gateway_event[self.gateway_event.index(event)]['scenes'] = self.sceneIds_array
-                    LOGGER.debug('longPoll trigger nodes {}'.format(self.gateway_event))
+                    event['shades'] = set(self.shadeIds_array)
+                    event['scenes'] = set(self.sceneIds_array)
+                    LOGGER.debug('longPoll trigger nodes %s', self.pendingEvents())
                 else:
-                    self.gateway_event.append({'evt': 'home', 'shades': [], 'scenes': []})
-                    LOGGER.debug('longPoll reset {}'.format(self.gateway_event))
+                    self.addEvent({'evt': 'home', 'shades': set(), 'scenes': set()})
+                    LOGGER.debug('longPoll reset %s', self.pendingEvents())
 
                 if self.Notices['hello']:
                     self.Notices.delete('hello')
             except:
                 LOGGER.error("LongPoll event error")
             self.heartbeat()
-            LOGGER.info("event(total) = {}".format(self.gateway_event))
+            LOGGER.info("event(total) = %s", self.pendingEvents())
         else:
             LOGGER.debug('shortPoll check for events (controller)')
             try:
                 if self.gateway_sse:
                     yy = self.sseProcess()
                     if yy != {}:
-                        self.gateway_event.append(yy)
-                        LOGGER.info(f"{self.eventTimer} new event = {yy}")
+                        self.addEvent(yy)
+                        LOGGER.info('%s new event = %s', self.eventTimer, yy)
                         self.eventTimer = 0
             except:
                 self.eventTimer += 1
-                LOGGER.info(f"increment eventTimer = {self.eventTimer}")
+                LOGGER.info('increment eventTimer = %s', self.eventTimer)
                 if self.eventTimer > self.eventTimeout:
                     self.gateway_sse = self.sseInit()
-                    LOGGER.info(f"eventTimeout")
+                    LOGGER.info('eventTimeout')
                     self.eventTimer = 0
 
     def sseProcess(self):
         x = self.gateway_sse
         y = next(x)
         y_next = ""
-        LOGGER.debug(f"json.loads-1 --{y}--")
+        LOGGER.debug('json.loads-1 --%s--', y)
         try:
             yy = json.loads(y)
-            LOGGER.info(f"json.loads-1-success --{yy}--")
+            LOGGER.info('json.loads-1-success --%s--', yy)
         except:
             y_next = next(x)
             y = y + y_next
-            LOGGER.debug(f"json.loads-2 --{y}--")
+            LOGGER.debug('json.loads-2 --%s--', y)
             try:
                 yy = json.loads(y)
-                LOGGER.info(f"json.loads-2-success --{yy}--")
+                LOGGER.info('json.loads-2-success --%s--', yy)
             except:
                 y_next = next(x)
                 y = y + y_next
-                LOGGER.debug(f"json.loads-3 --")
+                LOGGER.debug('json.loads-3 --')
                 try:
                     yy = json.loads(y)
-                    LOGGER.info(f"json.loads-3-success --{yy}--")
+                    LOGGER.info('json.loads-3-success --%s--', yy)
                 except:
-                    LOGGER.error(f"json.loads-none --{y}--")
+                    LOGGER.error('json.loads-none --%s--', y)
                     yy = {}
         return yy
                     
@@ -387,21 +396,99 @@ class Controller(udi_interface.Node):
         """
         connect and pull from the gateway stream of events ONLY FOR G3
         """
-        self.gateway_event = [{'evt': 'home', 'shades': [], 'scenes': []}]
+        self.resetEvents()
 
         if self.generation == 3:
             url = URL_EVENTS.format(g=self.gateway)
             try:
                sse = requests.get(url, headers={"Accept": "application/x-ldjson"}, stream=True)
                x = (s.rstrip() for s in sse)
-               y = str("raw = {}".format(next(x)))
-               LOGGER.info(y)
+               LOGGER.info('raw = %s', next(x))
             except:
                 x = False
         else:
             x = False
         return x
 
+    def resetEvents(self):
+        """
+        clear the gateway events, leaving only an empty home event
+        """
+        home = {'evt': 'home', 'shades': set(), 'scenes': set()}
+        with self.event_lock:
+            self.gateway_event_index = {('home', None): deque([home])}
+            self.gateway_event_ids = Counter()
+
+    def addEvent(self, event):
+        """
+        add a gateway event, indexed by (evt, id) so the nodes can pick up
+        their own events without scanning all pending events
+        each (evt, id) holds a fifo queue, oldest event first
+        shade motion/online events replace a waiting one of the same (evt, id)
+        as only the latest positions are of use to the shade
+        """
+        key = (event.get('evt'), event.get('id'))
+        with self.event_lock:
+            events = self.gateway_event_index.get(key)
+            if events and key[0] in COALESCE_EVENTS:
+                events.clear()
+                events.append(event)
+                return
+            self.gateway_event_index.setdefault(key, deque()).append(event)
+            if key[1] is not None:
+                self.gateway_event_ids[key[1]] += 1
+
+    def getEvent(self, evt, eid=None):
+        """
+        oldest pending event of type evt for the shade/scene eid, else None
+        """
+        with self.event_lock:
+            events = self.gateway_event_index.get((evt, eid))
+            if events:
+                return events[0]
+        return None
+
+    def removeEvent(self, event):
+        """
+        remove a handled event from the index
+        """
+        key = (event.get('evt'), event.get('id'))
+        with self.event_lock:
+            events = self.gateway_event_index.get(key)
+            if events:
+                if events[0] is event:
+                    events.popleft()
+                    self.dropEventId(key[1])
+                elif event in events:
+                    events.remove(event)
+                    self.dropEventId(key[1])
+                if not events:
+                    del self.gateway_event_index[key]
+
+    def pendingEvents(self):
+        """
+        list of all pending gateway events, for logging
+        """
+        with self.event_lock:
+            return [event for events in self.gateway_event_index.values() for event in events]
+
+    def hasEvents(self, eid):
+        """
+        quick check for any pending id'd event for the shade/scene eid
+        ids are shared between shades and scenes, so a hit still needs getEvent
+        """
+        return eid in self.gateway_event_ids
+
+    def dropEventId(self, eid):
+        """
+        count down a pending id, called with event_lock held
+        """
+        if eid is None:
+            return
+        self.gateway_event_ids[eid] -= 1
+        if self.gateway_event_ids[eid] <= 0:
+            del self.gateway_event_ids[eid]
+
     def query(self, command = None):
         """
         The query method will be called when the ISY attempts to query the
@@ -434,10 +521,10 @@ class Controller(udi_interface.Node):
         LOGGER.info("In Discovery...")
 
         nodes = self.poly.getNodes()
-        LOGGER.debug(f"current nodes = {nodes}")
+        LOGGER.debug('current nodes = %s', nodes)
         nodes_old = []
         for node in nodes:
-            LOGGER.debug(f"current node = {node}")
+            LOGGER.debug('current node = %s', node)
             if node != 'hdctrl':
                 nodes_old.append(node)
 
@@ -454,7 +541,7 @@ class Controller(udi_interface.Node):
                 try:
                     capabilities = int(shade['capabilities'])
                 except:
-                    LOGGER.error(f"no capabilties defined, use default shade")
+                    LOGGER.error('no capabilties defined, use default shade')
                     capabilities = int(0)
                 if shTxt not in nodes:
                     if capabilities in [7, 8]:
@@ -515,15 +602,15 @@ class Controller(udi_interface.Node):
 
         # remove nodes which do not exist in gateway
         nodes = self.poly.getNodesFromDb()
-        LOGGER.info(f"db nodes = {nodes}")
+        LOGGER.info('db nodes = %s', nodes)
         nodes = self.poly.getNodes()
         nodes_get = {key: nodes[key] for key in nodes if key != self.id}
-        LOGGER.info(f"old nodes = {nodes_old}")
-        LOGGER.info(f"new nodes = {nodes_new}")
-        LOGGER.info(f"pre-delete nodes = {nodes_get}")
+        LOGGER.info('old nodes = %s', nodes_old)
+        LOGGER.info('new nodes = %s', nodes_new)
+        LOGGER.info('pre-delete nodes = %s', nodes_get)
         for node in nodes_get:
             if (node not in nodes_new):
-                LOGGER.info(f"need to delete node {node}")
+                LOGGER.info('need to delete node %s', node)
                 self.poly.delNode(node)
 
         self.discovery = False
@@ -554,10 +641,10 @@ class Controller(udi_interface.Node):
         the ISY.  Programs on the ISY can then monitor this and take action
         when the heartbeat fails to update.
         """
-        LOGGER.debug('heartbeat: init={}'.format(init))
+        LOGGER.debug('heartbeat: init=%s', init)
         if init is not False:
             self.hb = init
-        LOGGER.debug('heartbeat: hb={}'.format(self.hb))
+        LOGGER.debug('heartbeat: hb=%s', self.hb)
         if self.hb == 0:
             self.reportCmd("DON",2)
             self.hb = 1
@@ -566,7 +653,7 @@ class Controller(udi_interface.Node):
             self.hb = 0
 
     def removeNoticesAll(self, command = None):
-        LOGGER.info('remove_notices_all: notices={}'.format(self.Notices))
+        LOGGER.info('remove_notices_all: notices=%s', self.Notices)
         # Remove all existing notices
         self.Notices.clear()
 
@@ -591,9 +678,11 @@ class Controller(udi_interface.Node):
                 self.roomIds_array = []
                 self.shades_array = []
                 self.shadeIds_array = []
+                self.shades_map = {}
                 self.scenes_array = []
                 self.sceneIds_array = []
-                self.sceneIdsActive_array = []
+                self.scenes_map = {}
+                self.sceneIdsActive_array = set()
 
                 for r in data["rooms"]:
                     LOGGER.debug('Update rooms')
@@ -602,7 +691,7 @@ class Controller(udi_interface.Node):
                     room_name = r['name']
                     room_name = room_name[0:ROOM_NAME_LIMIT]
                     for sh in r["shades"]:
-                        LOGGER.debug(f"Update shade {sh['id']}")
+                        LOGGER.debug('Update shade %s', sh['id'])
                         sh['shadeId'] = sh['id']
                         name = base64.b64decode(sh.pop('name')).decode()
                         sh['name'] = '%s - %s' % (room_name, name)
@@ -610,24 +699,21 @@ class Controller(udi_interface.Node):
                         if 'positions' in sh:
                             positions = sh['positions']
                             # Convert positions to integer percentages
-                            if 'primary' in positions:
-                                sh['positions']['primary'] = self.toPercent(positions['primary'])
-                            if 'secondary' in positions:
-                                sh['positions']['secondary'] = self.toPercent(positions['secondary'])
-                            if 'tilt' in positions:
-                                sh['positions']['tilt'] = self.toPercent(positions['tilt'])
-                            if 'velocity' in positions:
-                                sh['positions']['velocity'] = self.toPercent(positions['velocity'])
+                            for key in G3_POSITION_KEYS:
+                                if key in positions:
+                                    positions[key] = self.toPercent(positions[key])
                         self.shadeIds_array.append(sh["shadeId"])
                         self.shades_array.append(sh)
+                        self.shades_map[sh['id']] = sh
 
-                LOGGER.info(f"rooms = {self.roomIds_array}")
-                LOGGER.info(f"shades = {self.shadeIds_array}")
+                LOGGER.info('rooms = %s', self.roomIds_array)
+                LOGGER.info('shades = %s', self.shadeIds_array)
 
                 for sc in data["scenes"]:
-                    LOGGER.debug(f"update scenes {sc}")
+                    LOGGER.debug('update scenes %s', sc)
                     self.sceneIds_array.append(sc["_id"])
                     self.scenes_array.append(sc)
+                    self.scenes_map[sc["_id"]] = sc
                     name = sc['name']
                     LOGGER.debug("scenes-3")
                     if sc['room_Id'] == None:
@@ -638,13 +724,14 @@ class Controller(udi_interface.Node):
                     sc['name'] = '%s - %s' % (room_name, name)
                     LOGGER.debug('Update scenes-1')
 
-                LOGGER.info(f"scenes = {self.sceneIds_array}")
+                LOGGER.info('scenes = %s', self.sceneIds_array)
 
                 for sc in scenesActiveData:
-                    self.sceneIdsActive_array.append(sc["id"])
+                    self.sceneIdsActive_array.add(sc["id"])
 
-                LOGGER.info(f"activeScenes = {self.sceneIdsActive_array}")
+                LOGGER.info('activeScenes = %s', self.sceneIdsActive_array)
 
+                self.shades_version += 1
                 self.no_update = False
                 return True
             else:
@@ -662,8 +749,10 @@ class Controller(udi_interface.Node):
                 self.roomIds_array = []
                 self.shades_array = []
                 self.shadeIds_array = []
+                self.shades_map = {}
                 self.scenes_array = []
                 self.sceneIds_array = []
+                self.scenes_map = {}
 
                 res = self.get(URL_G2_ROOMS.format(g=self.gateway))
                 if res.status_code == requests.codes.ok:
@@ -672,7 +761,7 @@ class Controller(udi_interface.Node):
                     self.roomIds_array = data['roomIds']
                     for room in self.rooms_array:
                         room['name'] = base64.b64decode(room['name']).decode()
-                    LOGGER.info(f"rooms = {self.roomIds_array}")
+                    LOGGER.info('rooms = %s', self.roomIds_array)
                     
                 res = self.get(URL_G2_SHADES.format(g=self.gateway))
                 if res.status_code == requests.codes.ok:
@@ -684,6 +773,7 @@ class Controller(udi_interface.Node):
                         room_name = self.rooms_array[self.roomIds_array.index(shade['roomId'])]['name']
                         room_name = room_name[0:ROOM_NAME_LIMIT]
                         shade['name'] = '%s - %s' % (room_name, name)
+                        self.shades_map[shade['id']] = shade
                         if 'positions' in shade:
                             pos = shade['positions']
                             # Convert positions to integer percentages & handle tilt
@@ -697,7 +787,7 @@ class Controller(udi_interface.Node):
                                         shade['positions']['tilt'] = self.toPercent(pos['position1'], G2_DIVR)
                             if 'position2' in pos:
                                 shade['positions']['secondary'] = self.toPercent(pos['position2'], G2_DIVR)
-                    LOGGER.info(f"shades = {self.shadeIds_array}")
+                    LOGGER.info('shades = %s', self.shadeIds_array)
                     
                 res = self.get(URL_G2_SCENES.format(g=self.gateway))
                 if res.status_code == requests.codes.ok:
@@ -712,14 +802,16 @@ class Controller(udi_interface.Node):
                             room_name = self.rooms_array[self.roomIds_array.index(scene['roomId'])]['name']
                             room_name = room_name[0:ROOM_NAME_LIMIT]
                         scene['name'] = '%s - %s' % (room_name, name)
-                    LOGGER.info(f"scenes = {self.sceneIds_array}")
+                        self.scenes_map[scene['id']] = scene
+                    LOGGER.info('scenes = %s', self.sceneIds_array)
 
+                self.shades_version += 1
                 self.no_update = False
-                LOGGER.info(f"updateAllfromServerG2 = OK")
+                LOGGER.info('updateAllfromServerG2 = OK')
                 return True
             else:
                 self.no_update = False
-                LOGGER.error(f"updateAllfromServerG2 = NO DATA")
+                LOGGER.error('updateAllfromServerG2 = NO DATA')
                 return False
         except:
             LOGGER.error('updateAllfromServerG2 = except')
@@ -781,28 +873,28 @@ class Controller(udi_interface.Node):
         try:
             res = requests.get(url, headers={'accept': 'application/json'})
         except requests.exceptions.RequestException as e:
-            LOGGER.error(f"Error {e} fetching {url}")
+            LOGGER.error('Error %s fetching %s', e, url)
             res = requests.Response()
             res.status_code = 300
             res.raw = {"errMsg":"Error fetching from gateway, check configuration"}
             self.Notices['badfetch'] = "Error fetching from gateway"
             return res
         if res.status_code == 400:
-            LOGGER.info(f"Check if not primary {url}: {res.status_code}")
+            LOGGER.info('Check if not primary %s: %s', url, res.status_code)
             self.Notices['notPrimary'] = "Multi-Gateway environment - this is not primary"
             return res
         if res.status_code == 404:
-            LOGGER.info(f"Gateway wrong {url}: {res.status_code}")
+            LOGGER.info('Gateway wrong %s: %s', url, res.status_code)
             return res
         if res.status_code == 503:
-            LOGGER.info(f"HomeDoc not set-up {url}: {res.status_code}")
+            LOGGER.info('HomeDoc not set-up %s: %s', url, res.status_code)
             self.Notices['HomeDoc'] = "PowerView Set-up not Complete See TroubleShooting Guide"
             return res
         elif res.status_code != requests.codes.ok:
-            LOGGER.warn(f"Unexpected response fetching {url}: {res.status_code}")
+            LOGGER.warn('Unexpected response fetching %s: %s', url, res.status_code)
             return res
         else:
-            LOGGER.debug(f"Get from '{url}' returned {res.status_code}, response body '{res.text}'")
+            LOGGER.debug("Get from '%s' returned %s, response body '%s'", url, res.status_code, res.text)
         self.Notices.delete('badfetch')
         self.Notices.delete('notPrimary')
         self.Notices.delete('HomeDoc')
@@ -810,7 +902,7 @@ class Controller(udi_interface.Node):
 
     def toPercent(self, pos, divr=1.0):
         newpos = math.trunc((float(pos) / divr * 100.0) + 0.5)
-        LOGGER.debug(f"toPercent: pos={pos}, becomes {newpos}")
+        LOGGER.debug('toPercent: pos=%s, becomes %s', pos, newpos)
         return newpos
 
     def put(self, url, data=None):
@@ -822,18 +914,18 @@ class Controller(udi_interface.Node):
                 res = requests.put(url, headers={'accept': 'application/json'})
 
         except requests.exceptions.RequestException as e:
-            LOGGER.error(f"Error {e} in put {url} with data {data}:", exc_info=True)
+            LOGGER.error('Error %s in put %s with data %s:', e, url, data, exc_info=True)
             if res:
-                LOGGER.debug(f"Put from '{url}' returned {res.status_code}, response body '{res.text}'")
+                LOGGER.debug("Put from '%s' returned %s, response body '%s'", url, res.status_code, res.text)
             return False
 
         if res and res.status_code != requests.codes.ok:
-            LOGGER.error('Unexpected response in put %s: %s' % (url, str(res.status_code)))
-            LOGGER.debug(f"Put from '{url}' returned {res.status_code}, response body '{res.text}'")
+            LOGGER.error('Unexpected response in put %s: %s', url, res.status_code)
+            LOGGER.debug("Put from '%s' returned %s, response body '%s'", url, res.status_code, res.text)
             return False
 
         response = res.json()
-        LOGGER.debug(f"Put from '{url}' returned {res.status_code}, response body '{res.text}'")
+        LOGGER.debug("Put from '%s' returned %s, response body '%s'", url, res.status_code, res.text)
         return response
 
 
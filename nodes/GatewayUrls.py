@@ -0,0 +1,27 @@
+"""
+udi-HunterDouglas-pg3 NodeServer/Plugin for EISY/Polisy
+
+(C) 2024 Stephen Jenkins
+
+GatewayUrls class
+"""
+
+class GatewayUrls:
+    """
+    mix-in for the Shade and Scene nodes, url's formatted with the gateway
+    and the node's sid, needs self.controller, self.sid, self.urls and
+    self.url_gateway set in __init__
+    """
+    def getUrl(self, url):
+        """
+        url formatted for this node, cached until the gateway changes
+        """
+        gateway = self.controller.gateway
+        if gateway != self.url_gateway:
+            self.urls = {}
+            self.url_gateway = gateway
+        nodeUrl = self.urls.get(url)
+        if nodeUrl is None:
+            nodeUrl = url.format(g=gateway, id=self.sid)
+            self.urls[url] = nodeUrl
+        return nodeUrl
@@ -11,6 +11,9 @@ Scene class
 # external libraries
 import udi_interface
 
+# personal libraries
+from .GatewayUrls import GatewayUrls
+
 LOGGER = udi_interface.LOGGER
 
 """
@@ -45,7 +48,7 @@ URL_G2_SCENE = 'http://{g}/api/scenes?sceneid={id}'
 URL_G2_SCENES_ACTIVATE = 'http://{g}/api/scenes?sceneId={id}'
 G2_DIVR = 65535
 
-class Scene(udi_interface.Node):
+class Scene(GatewayUrls, udi_interface.Node):
     id = 'sceneid'
 
     """
@@ -91,6 +94,10 @@ class Scene(udi_interface.Node):
 
         self.lpfx = '%s:%s' % (address,name)
         self.sid = sid
+        # scene nodes are created for the gateway generation found at discovery
+        self.generation = self.controller.generation
+        self.urls = {}
+        self.url_gateway = None
 
         self.poly.subscribe(self.poly.START, self.start, address)
         self.poly.subscribe(self.poly.POLL, self.poll)
@@ -108,9 +115,9 @@ class Scene(udi_interface.Node):
         self.rename(self.name)
 
     def poll(self, flag):
-        if 'longPoll' in flag:
-            LOGGER.debug(f"longPoll scene {self.lpfx}")
-            if self.controller.generation == 2:
+        if flag == 'longPoll':
+            LOGGER.debug('longPoll scene %s', self.lpfx)
+            if self.generation == 2:
                 self.setDriver('ST', 0)
                 # manually turn off activation for G2
         else:
@@ -118,46 +125,38 @@ class Scene(udi_interface.Node):
             self.events()
 
     def events(self):
-       # home update event
-        event = list(filter(lambda events: events['evt'] == 'home', self.controller.gateway_event))
+        ctrl = self.controller
+        sid = self.sid
+        # home update event
+        event = ctrl.getEvent('home')
         if event:
-            event = event[0]
-            if event['scenes'].count(self.sid) > 0:
+            if sid in event['scenes']:
                 try:
-                    LOGGER.info(f'shortPoll scene {self.sid} update')
-                    if self.controller.generation == 2:
-                        try:
-                            data = list(filter(lambda scene: scene['id'] == self.sid, self.controller.scenes_array))
-                        except:
-                            LOGGER.error('scene: sid:{self.sid}, data error')
-                    else:
-                        data = list(filter(lambda scene: scene['_id'] == self.sid, self.controller.scenes_array))
-                
+                    LOGGER.info('shortPoll scene %s update', sid)
+                    data = ctrl.scenes_map.get(sid)
                     if data:
-                        self.scenedata = data[0]
-                        if self.name != self.scenedata['name']:
-                            LOGGER.warn(f"scene: sid:{self.sid}, name != scenedata[name]")
-                            if self.controller.generation == 2:
-                                LOGGER.warn(f"scene: sid:{self.sid}, self.name:{self.name}, id:{self.scenedata['id']}, name:{self.scenedata['name']}")
+                        self.scenedata = data
+                        if self.name != data['name']:
+                            LOGGER.warn('scene: sid:%s, name != scenedata[name]', sid)
+                            if self.generation == 2:
+                                LOGGER.warn('scene: sid:%s, self.name:%s, id:%s, name:%s', sid, self.name, data['id'], data['name'])
                             else:
-                                LOGGER.warn(f"scene: sid:{self.sid}, self.name:{self.name}, _id:{self.scenedata['_id']}, name:{self.scenedata['name']}")
-                            LOGGER.warn(f"scene name changed from {self.name} to {self.scenedata['name']}")
-                            self.rename(self.scenedata['name'])
-                        if self.controller.generation == 3:
+                                LOGGER.warn('scene: sid:%s, self.name:%s, _id:%s, name:%s', sid, self.name, data['_id'], data['name'])
+                            LOGGER.warn('scene name changed from %s to %s', self.name, data['name'])
+                            self.rename(data['name'])
+                        if self.generation == 3:
                             # update activation state only if G3 as array is [] for G2
-                            old = self.getDriver('ST')
-                            if self.controller.sceneIdsActive_array.count(self.sid) > 0:
-                                if old != 1:
-                                    self.setDriver('ST', 1)
-                                    LOGGER.info(f"scene {self.sid} activation updated ON")
+                            # setDriver only reports to ISY when the value changed
+                            if sid in ctrl.sceneIdsActive_array:
+                                if self.setDriver('ST', 1):
+                                    LOGGER.info('scene %s activation updated ON', sid)
                             else:
-                                if old != 0:
-                                    self.setDriver('ST', 0)
-                                    LOGGER.info(f"scene {self.sid} activation updated OFF")
+                                if self.setDriver('ST', 0):
+                                    LOGGER.info('scene %s activation updated OFF', sid)
                         
-                    self.controller.gateway_event[self.controller.gateway_event.index(event)]['scenes'].remove(self.sid)
+                    event['scenes'].discard(sid)
                 except Exception:
-                    LOGGER.error(f"scene event error sid = {self.sid}")
+                    LOGGER.error('scene event error sid = %s', sid)
             else:
                 pass
                 # LOGGER.debug(f'shortPoll scene {self.sid} home evt but update already')
@@ -166,36 +165,37 @@ class Scene(udi_interface.Node):
             # LOGGER.debug(f'shortPoll scene {self.sid} no home evt')
 
         # NOTE rest of the events below are only for G3, will not fire for G2
-        event = list(filter(lambda events: (events['evt'] == 'scene-activated' or events['evt'] == 'scene-deactivated'), \
-                            self.controller.gateway_event))
+        # the controller indexes events by id, so only this scene's events are seen
+        if not ctrl.hasEvents(sid):
+            return
+        getEvent = ctrl.getEvent
+        event = [e for e in (getEvent('scene-activated', sid),
+                             getEvent('scene-deactivated', sid)) if e]
         if event:
-            event = event[0]
+            event = min(event, key=lambda e: e.get('isoDate', ''))
             # LOGGER.debug(f"shortpoll scene {self.sid} - {event['id']} - {event}")
-            if int(event['id']) == int(self.sid):
-                act = event['evt'] == 'scene-activated'
-                if act:
-                    self.setDriver('ST', 1)
-                else:
-                    self.setDriver('ST', 0)
-                LOGGER.info(f"shortPoll {event['evt']}: {self.lpfx}")
-                self.controller.gateway_event.remove(event)
+            act = event['evt'] == 'scene-activated'
+            if act:
+                self.setDriver('ST', 1)
+            else:
+                self.setDriver('ST', 0)
+            LOGGER.info('shortPoll %s: %s', event['evt'], self.lpfx)
+            ctrl.removeEvent(event)
                 
     def cmdActivate(self, command = None):
         """
         activate scene
         """
-        if self.controller.generation == 2:
-            activateSceneUrl = URL_G2_SCENES_ACTIVATE.format(g=self.controller.gateway, id=self.sid)
-            self.controller.get(activateSceneUrl)
+        if self.generation == 2:
+            self.controller.get(self.getUrl(URL_G2_SCENES_ACTIVATE))
         else:
-            activateSceneUrl = URL_SCENES_ACTIVATE.format(g=self.controller.gateway, id=self.sid)
-            self.controller.put(activateSceneUrl)
+            self.controller.put(self.getUrl(URL_SCENES_ACTIVATE))
 
-        LOGGER.info(f"cmdActivate initiate {self.lpfx}")
+        LOGGER.info('cmdActivate initiate %s', self.lpfx)
 
         # for PowerView G2 gateway there is no event so manually trigger activate
         # PowerView G3 will receive an activate event when the motion is complete
-        if self.controller.generation == 2:
+        if self.generation == 2:
             self.setDriver('ST', 1)
             # manually turn on for G2, turn off on the next longPoll
 
@@ -8,11 +8,15 @@ Shade class
 """
 
 # std libraries
-import math
+import logging
+import threading
 
 # external libraries
 import udi_interface
 
+# personal libraries
+from .GatewayUrls import GatewayUrls
+
 LOGGER = udi_interface.LOGGER
 
 """
@@ -46,9 +50,45 @@ URL_G2_SCENES = 'http://{g}/api/scenes'
 URL_G2_SCENE = 'http://{g}/api/scenes?sceneid={id}'
 URL_G2_SCENES_ACTIVATE = 'http://{g}/api/scenes?sceneId={id}'
 G2_DIVR = 65535
+G2_POSKIND_PRIMARY = 1
+G2_POSKIND_SECONDARY = 2 #unknown if this is the only possible number
+G2_POSKIND_TILT = 3
+# positions sharing the G2 posKind1/position1 slot
+G2_POSKIND1_KEYS = frozenset({'primary', 'tilt'})
+# shade capabilities with tilt, and those limited to 90 degrees of tilt
+TILT_CAPABLE = frozenset({1, 2, 4, 5, 9, 10})
+TILT_ONLY_90_CAPABLE = frozenset({1, 9})
+POSITION_DELAY = 0.1 # seconds to gather position commands into one put
+# SETPOS command query parameters for each position
+SETPOS_PARAMS = (('primary', 'SETPRIM.uom100'),
+                 ('secondary', 'SETSECO.uom100'),
+                 ('tilt', 'SETTILT.uom100'))
 
-class Shade(udi_interface.Node):
+"""
+Shade drivers, shared by the Shade classes (each node gets its own copy)
+"""
+DRIVER_SHADE_ID = {'driver': 'GV0', 'value': 0, 'uom': 107, 'name': "Shade Id"}
+DRIVER_MOTION = {'driver': 'ST', 'value': 0, 'uom': 2, 'name': "In Motion"}
+DRIVER_ROOM_ID = {'driver': 'GV1', 'value': 0, 'uom': 107, 'name': "Room Id"}
+DRIVER_PRIMARY = {'driver': 'GV2', 'value': None, 'uom': 100, 'name': "Primary"}
+DRIVER_SECONDARY = {'driver': 'GV3', 'value': None, 'uom': 100, 'name': "Secondary"}
+DRIVER_TILT = {'driver': 'GV4', 'value': None, 'uom': 100, 'name': "Tilt"}
+DRIVER_CAPABILITIES = {'driver': 'GV5', 'value': 0, 'uom': 25, 'name': "Capabilities"}
+DRIVER_BATTERY = {'driver': 'GV6', 'value': 0, 'uom': 25, 'name': "Battery Status"}
+
+class Shade(GatewayUrls, udi_interface.Node):
     id = 'shadeid'
+
+    # G3 shade events handled in events() by isoDate: (evt, ST value or None, log level)
+    shadeEvents = (
+        ('motion-started', 1, logging.INFO),
+        ('motion-stopped', 0, logging.INFO),
+        ('shade-online', None, logging.INFO),
+        ('shade-offline', None, logging.ERROR),
+    )
+
+    # (driver, position key) updated by updatePositions, narrowed by the sub-classes
+    positionDrivers = (('GV2', 'primary'), ('GV3', 'secondary'), ('GV4', 'tilt'))
     
     """
     This is the class that all the Nodes will be represented by. You will
@@ -93,19 +133,29 @@ class Shade(udi_interface.Node):
         try:
             self.capabilities = int(shade['capabilities'])
         except:
-            LOGGER.error(f"no capabilties defined, use default shade")
+            LOGGER.error("no capabilties defined, use default shade")
             self.capabilities = int(0)
 
-        if self.controller.generation == 2:
+        # shade nodes are created for the gateway generation found at discovery
+        self.generation = self.controller.generation
+        if self.generation == 2:
             self.sid = shade['id']
+            self.putShadePosition = self.putShadePositionG2
         else:
             self.sid = shade['shadeId']
+            self.putShadePosition = self.putShadePositionG3
 
-        self.tiltCapable = [1, 2, 4, 5, 9, 10]
-        self.tiltOnly90Capable = [1, 9]
- 
         self.lpfx = '%s:%s' % (address,name)
 
+        self.shades_version = None
+        self.datasig = None
+        self.urls = {}
+        self.url_gateway = None
+
+        self.pending_pos = {}
+        self.pos_timer = None
+        self.pos_lock = threading.Lock()
+
         self.poly.subscribe(self.poly.START, self.start, address)
         self.poly.subscribe(self.poly.POLL, self.poll)
         
@@ -120,112 +170,78 @@ class Shade(udi_interface.Node):
         self.rename(self.name)
 
     def poll(self, flag):
-        if 'longPoll' in flag:
-            LOGGER.debug(f'longPoll shade {self.lpfx}')
+        if flag == 'longPoll':
+            LOGGER.debug('longPoll shade %s', self.lpfx)
         else:
             # LOGGER.debug('shortPoll (shade)')
             self.events()
 
     def events(self):
+        ctrl = self.controller
+        sid = self.sid
         # home update event
-        try:
-            event = list(filter(lambda events: events['evt'] == 'home', self.controller.gateway_event))
-        except Exception as ex:
-            LOGGER.error(f"shade {self.sid} home event error: {ex}")
-        else:            
-            if event:
-                event = event[0]
-                if event['shades'].count(self.sid) > 0:
-                    LOGGER.info(f'shortPoll shade {self.sid} update')
-                    if self.updateData():
-                        try:
-                            self.controller.gateway_event[self.controller.gateway_event.index(event)]['shades'].remove(self.sid)
-                        except:
-                            LOGGER.error(f"shade event error sid = {self.sid}")
-                else:
-                    pass
-                    # LOGGER.debug(f'shortPoll shade {self.sid} home evt but update already')
+        event = ctrl.getEvent('home')
+        if event:
+            if sid in event['shades']:
+                LOGGER.info('shortPoll shade %s update', sid)
+                if self.updateData():
+                    event['shades'].discard(sid)
             else:
                 pass
-                # LOGGER.debug(f'shortPoll shade {self.sid} no home evt')
+                # LOGGER.debug(f'shortPoll shade {self.sid} home evt but update already')
+        else:
+            pass
+            # LOGGER.debug(f'shortPoll shade {self.sid} no home evt')
 
         # NOTE rest of the events below are only for G3, will not fire for G2
-
-        # motion-started event
-        try:
-            event = list(filter(lambda events: (events['evt'] == 'motion-started' and events['id'] == self.sid), \
-                            self.controller.gateway_event))
-        except Exception as ex:
-            LOGGER.error(f"shade {self.sid} motion-started event error: {ex}")
-        else:
+        # the controller indexes events by (evt, id), so only this shade's events are seen
+        if not ctrl.hasEvents(sid):
+            return
+
+        # handle the oldest first, so the newest event leaves the drivers set
+        pending = []
+        for evt, st, level in self.shadeEvents:
+            event = ctrl.getEvent(evt, sid)
             if event:
-                event = event[0]
-                self.positions = self.posToPercent(event['currentPositions'])
-                if self.updatePositions():
-                    self.setDriver('ST', 1)
-                    LOGGER.info(f'shortPoll shade {self.sid} motion-started event')
-                    self.controller.gateway_event.remove(event)
-                   
-        # motion-stopped event
-        try:
-            event = list(filter(lambda events: (events['evt'] == 'motion-stopped' and events['id'] == self.sid), \
-                            self.controller.gateway_event))
-        except Exception as ex:
-            LOGGER.error(f"shade {self.sid} motion-stopped event error: {ex}")
-        else:
-            if event:
-                event = event[0]
-                self.positions = self.posToPercent(event['currentPositions'])
-                if self.updatePositions():
-                    self.setDriver('ST', 0)
-                    LOGGER.info(f'shortPoll shade {self.sid} motion-stopped event')
-                    self.controller.gateway_event.remove(event)
-                   
-        # shade-online event
-        try:
-            event = list(filter(lambda events: (events['evt'] == 'shade-online' and events['id'] == self.sid), \
-                            self.controller.gateway_event))
-        except Exception as ex:
-            LOGGER.error(f"shade {self.sid} shade-online event error: {ex}")
-        else:
-            if event:
-                event = event[0]
-                self.positions = self.posToPercent(event['currentPositions'])
-                if self.updatePositions():
-                    LOGGER.info(f'shortPoll shade {self.sid} shade-online event')
-                    self.controller.gateway_event.remove(event)
-                   
-        # shade-offline event
-        try:
-            event = list(filter(lambda events: (events['evt'] == 'shade-offline' and events['id'] == self.sid), \
-                            self.controller.gateway_event))
-        except Exception as ex:
-            LOGGER.error(f"shade {self.sid} shade-offline event error: {ex}")
-        else:
-            if event:
-                event = event[0]
-                self.positions = self.posToPercent(event['currentPositions'])
-                if self.updatePositions():
-                    LOGGER.error(f'shortPoll shade {self.sid} shade-offline event')
-                    self.controller.gateway_event.remove(event)
-                   
+                pending.append((event, st, level))
+        pending.sort(key=lambda p: p[0].get('isoDate', ''))
+        for event, st, level in pending:
+            self.positions = self.posToPercent(event['currentPositions'])
+            # drivers no longer match the last home data, resync on the next one
+            self.datasig = None
+            if self.updatePositions():
+                if st is not None:
+                    self.setDriver('ST', st)
+                LOGGER.log(level, 'shortPoll shade %s %s event', sid, event['evt'])
+                ctrl.removeEvent(event)
+
     def updateData(self):
-        if self.controller.no_update == False:
-            # LOGGER.debug(self.controller.shades_array)
-            data = list(filter(lambda shade: shade['id'] == self.sid, self.controller.shades_array))
-            LOGGER.debug(f"shade {self.sid} is {data}")
+        ctrl = self.controller
+        if not ctrl.no_update:
+            version = ctrl.shades_version
+            if version == self.shades_version:
+                return True
+            data = ctrl.shades_map.get(self.sid)
+            LOGGER.debug('shade %s is %s', self.sid, data)
             if data:
-                self.shadedata = data[0]
+                self.shadedata = data
+                self.shades_version = version
+                # skip the driver updates if nothing in the shade data changed
+                datasig = (data['name'], data["roomId"], data["batteryStatus"], data.get("capabilities"),
+                           tuple(sorted(data["positions"].items())))
+                if datasig == self.datasig:
+                    return True
+                self.datasig = datasig
                 if self.name != self.shadedata['name']:
-                    LOGGER.warn(f"Name error current:{self.name}  new:{self.shadedata['name']}")
+                    LOGGER.warn('Name error current:%s  new:%s', self.name, self.shadedata['name'])
                     self.rename(self.shadedata['name'])
-                    LOGGER.warn(f"Renamed {self.name}")
+                    LOGGER.warn('Renamed %s', self.name)
                 self.setDriver('GV1', self.shadedata["roomId"])
                 self.setDriver('GV6', self.shadedata["batteryStatus"])
                 try:
                     self.capabilities = int(self.shadedata["capabilities"])
                 except:
-                    LOGGER.error(f"no capabilties defined, use default shade")
+                    LOGGER.error("no capabilties defined, use default shade")
                     self.capabilities = int(0)
                 self.setDriver('GV5', self.capabilities)
                 self.positions = self.shadedata["positions"]
@@ -235,55 +251,31 @@ class Shade(udi_interface.Node):
             return False
 
     def updatePositions(self):
-        if 'primary' in self.positions:
-            p1 = self.positions['primary']
-        else:
-            p1 = None
-        if 'secondary' in self.positions:
-            p2 = self.positions['secondary']
-        else:
-            p2 = None
-        if 'tilt' in self.positions:
-            t1 = self.positions['tilt']
-        else:
-            if self.capabilities in self.tiltCapable:
-                t1 = 0
+        pos = self.positions
+        # tilt capable shades show 0 when the gateway sends no tilt
+        tilt = 0 if self.capabilities in TILT_CAPABLE else None
+        LOGGER.debug('updatePositions %s %s %s', pos.get('primary'), pos.get('secondary'), pos.get('tilt', tilt))
+
+        for driver, key in self.positionDrivers:
+            if key == 'tilt':
+                self.setDriver(driver, pos.get(key, tilt))
             else:
-                t1 = None
-        LOGGER.debug(f"updatePositions {p1} {p2} {t1}")
-            
-        if self.capabilities in [7, 8]:
-            self.setDriver('GV2', p1)
-            self.setDriver('GV3', p2)
-        elif self.capabilities in [0, 3]:
-            self.setDriver('GV2', p1)
-        elif self.capabilities == 6:
-            self.setDriver('GV3', p2)
-        elif self.capabilities in [1, 2, 4]:
-            self.setDriver('GV2', p1)
-            self.setDriver('GV4', t1)
-        elif self.capabilities == 5:
-            self.setDriver('GV4', t1)
-        else: # 9, 10 , unknown
-            self.setDriver('GV2', p1)
-            self.setDriver('GV3', p2)
-            self.setDriver('GV4', t1)
+                self.setDriver(driver, pos.get(key))
         return True
 
     def posToPercent(self, pos):
         """
         only used for PowerView G3 events
         """
-        for key in pos:
-            pos[key] = self.controller.toPercent(pos[key])
-        return pos
+        toPercent = self.controller.toPercent
+        return {key: toPercent(value) for key, value in pos.items()}
         
     def cmdOpen(self, command):
         """
         open shade
         """
         LOGGER.info('cmd Shade Open %s', self.lpfx)
-        if self.controller.generation == 2:
+        if self.generation == 2:
             self.positions["primary"] = 100
         else:
             self.positions["primary"] = 0
@@ -294,7 +286,7 @@ class Shade(udi_interface.Node):
         close shade
         """
         LOGGER.info('cmd Shade Close %s', self.lpfx)
-        if self.controller.generation == 2:
+        if self.generation == 2:
             self.positions["primary"] = 0
         else:
             self.positions["primary"] = 100
@@ -305,8 +297,8 @@ class Shade(udi_interface.Node):
         stop shade
         only available in PowerView G3
         """
-        if self.controller.generation == 3:
-            shadeUrl = URL_SHADES_STOP.format(g=self.controller.gateway, id=self.sid)
+        if self.generation == 3:
+            shadeUrl = self.getUrl(URL_SHADES_STOP)
             self.controller.put(shadeUrl)
             LOGGER.info('cmd Shade Stop %s', self.lpfx)
 
@@ -333,11 +325,11 @@ class Shade(udi_interface.Node):
         PowerView G2 will send updateBatteryLevel which also jogs shade
         Battery level updates are automatic in PowerView G3
         """
-        if self.controller.generation == 2:
-            shadeUrl = URL_G2_SHADE_BATTERY.format(g=self.controller.gateway, id=self.sid)
+        if self.generation == 2:
+            shadeUrl = self.getUrl(URL_G2_SHADE_BATTERY)
             body = {}
         else:
-            shadeUrl = URL_SHADES_MOTION.format(g=self.controller.gateway, id=self.sid)
+            shadeUrl = self.getUrl(URL_SHADES_MOTION)
             body = {
                 "motion": "jog"
             }
@@ -351,8 +343,8 @@ class Shade(udi_interface.Node):
         only available in PowerView G2, automatic in PowerView G3
         TODO not implemented
         """
-        if self.controller.generation == 2:
-            shadeUrl = URL_G2_SHADE.format(g=self.controller.gateway, id=self.sid)
+        if self.generation == 2:
+            shadeUrl = self.getUrl(URL_G2_SHADE)
             body = {
                 'shade': {
                     "motion": 'calibrate'
@@ -376,99 +368,136 @@ class Shade(udi_interface.Node):
         """
         setting primary, secondary, tilt
         """
-        try:
-            pos = {}
-            LOGGER.info('Shade Setpos command %s', command)
-            query = command.get("query")
-            LOGGER.info('Shade Setpos query %s', query)
-            if "SETPRIM.uom100" in query:
-                pos["primary"] = int(query["SETPRIM.uom100"])
-            if "SETSECO.uom100" in query:
-                pos["secondary"] = int(query["SETSECO.uom100"])
-            if "SETTILT.uom100" in query:
-                pos["tilt"] = int(query["SETTILT.uom100"])
-            if pos != {}:
-                LOGGER.info('Shade Setpos %s', pos)
-                self.setShadePosition(pos)
-                self.positions.update(pos)
-            else:
-                LOGGER.error('Shade Setpos --nothing to set--')
-        except:
-            LOGGER.error('Shade Setpos failed %s', self.lpfx)
+        LOGGER.info('Shade Setpos command %s', command)
+        query = command.get("query") or {}
+        LOGGER.info('Shade Setpos query %s', query)
+        pos = {}
+        for key, param in SETPOS_PARAMS:
+            value = query.get(param)
+            if value is not None:
+                try:
+                    pos[key] = int(value)
+                except (TypeError, ValueError):
+                    LOGGER.error('Shade Setpos %s bad value %s %s', param, value, self.lpfx)
+        if pos:
+            LOGGER.info('Shade Setpos %s', pos)
+            self.setShadePosition(pos)
+            self.positions.update(pos)
+        else:
+            LOGGER.error('Shade Setpos --nothing to set--')
 
     def setShadePosition(self, pos):
+        """
+        queue the positions, commands within POSITION_DELAY go out as one put
+        G2 primary and tilt share posKind1, so a queued put using it for the
+        other position is sent first and the last command still wins
+        """
+        with self.pos_lock:
+            if self.generation == 2 and self.pending_pos:
+                queued = G2_POSKIND1_KEYS.intersection(self.pending_pos)
+                incoming = G2_POSKIND1_KEYS.intersection(pos)
+                if queued and incoming and queued != incoming:
+                    self.putShadePosition(self.pending_pos)
+                    self.pending_pos = {}
+            self.pending_pos.update(pos)
+            if self.pos_timer is None:
+                self.pos_timer = threading.Timer(POSITION_DELAY, self.flushShadePosition)
+                self.pos_timer.daemon = True
+                self.pos_timer.start()
+        return True
+
+    def flushShadePosition(self):
+        """
+        send the merged pending positions to the gateway
+        """
+        with self.pos_lock:
+            pos = self.pending_pos
+            self.pending_pos = {}
+            self.pos_timer = None
+        if pos:
+            self.putShadePosition(pos)
+
+    def putShadePositionG2(self, pos):
+        """
+        PowerView G2 position put, bound as putShadePosition in __init__
+        """
         positions_array = {}
-        if self.controller.generation == 2:
-            if self.capabilities in self.tiltCapable:
-                if 'tilt' in pos:
-                    tilt = pos['tilt']
-                    if self.capabilities in self.tiltOnly90Capable:
-                        if tilt >= 50:
-                            tilt = 49
-                    tilt = self.fromPercent(tilt, G2_DIVR)
-                    posk1 = 3
-                    positions_array.update({'posKind1': posk1, 'position1': tilt})
-
-            if 'primary' in pos:
-                pos1 = self.fromPercent(pos['primary'], G2_DIVR)
-                posk1 = 1
-                positions_array.update({'posKind1': posk1, 'position1': pos1})
-
-            if 'secondary' in pos:
-                pos2 = self.fromPercent(pos['secondary'], G2_DIVR)
-                posk2 = 2 #unknown if this is the only possible number
-                positions_array.update({'posKind2': posk2, 'position2': pos2})
-
-            pos = {
-                "shade": {
-                    "positions": positions_array
-                }
+        if self.capabilities in TILT_CAPABLE:
+            if 'tilt' in pos:
+                tilt = pos['tilt']
+                if self.capabilities in TILT_ONLY_90_CAPABLE:
+                    tilt = min(tilt, 49)
+                positions_array['posKind1'] = G2_POSKIND_TILT
+                positions_array['position1'] = self.fromPercentG2(tilt)
+
+        if 'primary' in pos:
+            positions_array['posKind1'] = G2_POSKIND_PRIMARY
+            positions_array['position1'] = self.fromPercentG2(pos['primary'])
+
+        if 'secondary' in pos:
+            positions_array['posKind2'] = G2_POSKIND_SECONDARY
+            positions_array['position2'] = self.fromPercentG2(pos['secondary'])
+
+        pos = {
+            "shade": {
+                "positions": positions_array
             }
-            shade_url = URL_G2_SHADE.format(g=self.controller.gateway, id=self.sid)
-        else:
-            if 'primary' in pos:
-                positions_array["primary"] = self.fromPercent(pos['primary'])
+        }
+        shade_url = self.getUrl(URL_G2_SHADE)
+        self.controller.put(shade_url, data=pos)
+        LOGGER.info('setShadePosition = %s , %s', shade_url, pos)
+        return True
 
-            if 'secondary' in pos:
-                positions_array["secondary"] = self.fromPercent(pos['secondary'])
+    def putShadePositionG3(self, pos):
+        """
+        PowerView G3 position put, bound as putShadePosition in __init__
+        """
+        positions_array = {}
+        if 'primary' in pos:
+            positions_array["primary"] = self.fromPercentG3(pos['primary'])
 
-            if self.capabilities in self.tiltCapable:
-                if 'tilt' in pos:
-                    tilt = pos['tilt']
-                    if self.capabilities in self.tiltOnly90Capable:
-                        if tilt >= 50:
-                            tilt = 49                    
-                    positions_array["tilt"] = self.fromPercent(tilt)
+        if 'secondary' in pos:
+            positions_array["secondary"] = self.fromPercentG3(pos['secondary'])
 
-            if 'velocity' in pos:
-                positions_array["velocity"] = self.fromPercent(pos['velocity'])
+        if self.capabilities in TILT_CAPABLE:
+            if 'tilt' in pos:
+                tilt = pos['tilt']
+                if self.capabilities in TILT_ONLY_90_CAPABLE:
+                    tilt = min(tilt, 49)
+                positions_array["tilt"] = self.fromPercentG3(tilt)
 
-            pos = {'positions': positions_array}
-            shade_url = URL_SHADES_POSITIONS.format(g=self.controller.gateway, id=self.sid)
+        if 'velocity' in pos:
+            positions_array["velocity"] = self.fromPercentG3(pos['velocity'])
 
+        pos = {'positions': positions_array}
+        shade_url = self.getUrl(URL_SHADES_POSITIONS)
         self.controller.put(shade_url, data=pos)
-        LOGGER.info(f"setShadePosition = {shade_url} , {pos}")
+        LOGGER.info('setShadePosition = %s , %s', shade_url, pos)
         return True
 
-    def fromPercent(self, pos, divr=1.0):
-        if self.controller.generation == 2:
-            newpos = math.trunc((float(pos) / 100.0) * divr)
-        else:
-            newpos = (float(pos) / 100.0) * divr
-        LOGGER.debug(f"fromPercent: pos={pos}, becomes {newpos}")
-        return newpos
+    def fromPercentG2(self, pos, divr=G2_DIVR):
+        """
+        PowerView G2 integer position from a percentage
+        """
+        return int(pos * divr) // 100
+
+    def fromPercentG3(self, pos):
+        """
+        PowerView G3 fractional position from a percentage
+        """
+        return float(pos) / 100.0
 
     # all the drivers - for reference
     # TODO velocity not implemented
     drivers = [
-        {'driver': 'GV0', 'value': 0, 'uom': 107, 'name': "Shade Id"},
-        {'driver': 'ST', 'value': 0, 'uom': 2, 'name': "In Motion"}, 
-        {'driver': 'GV1', 'value': 0, 'uom': 107, 'name': "Room Id"},
-        {'driver': 'GV2', 'value': None, 'uom': 100, 'name': "Primary"},
-        {'driver': 'GV3', 'value': None, 'uom': 100, 'name': "Secondary"},
-        {'driver': 'GV4', 'value': None, 'uom': 100, 'name': "Tilt"},
-        {'driver': 'GV5', 'value': 0, 'uom': 25, 'name': "Capabilities"},
-        {'driver': 'GV6', 'value': 0, 'uom': 25, 'name': "Battery Status"},
+        DRIVER_SHADE_ID,
+        DRIVER_MOTION,
+        DRIVER_ROOM_ID,
+        DRIVER_PRIMARY,
+        DRIVER_SECONDARY,
+        DRIVER_TILT,
+        DRIVER_CAPABILITIES,
+        DRIVER_BATTERY,
         ]
 
     """
@@ -493,64 +522,69 @@ class Shade(udi_interface.Node):
 
 class ShadeNoTilt(Shade):
     id = 'shadenotiltid'
+    positionDrivers = (('GV2', 'primary'), ('GV3', 'secondary'))
 
     drivers = [
-        {'driver': 'GV0', 'value': 0, 'uom': 107, 'name': "Shade Id"},
-        {'driver': 'ST', 'value': 0, 'uom': 2, 'name': "In Motion"}, 
-        {'driver': 'GV1', 'value': 0, 'uom': 107, 'name': "Room Id"},
-        {'driver': 'GV2', 'value': None, 'uom': 100, 'name': "Primary"},
-        {'driver': 'GV3', 'value': None, 'uom': 100, 'name': "Secondary"},
-        {'driver': 'GV5', 'value': 0, 'uom': 25, 'name': "Capabilities"},
-        {'driver': 'GV6', 'value': 0, 'uom': 25, 'name': "Battery Status"},
+        DRIVER_SHADE_ID,
+        DRIVER_MOTION,
+        DRIVER_ROOM_ID,
+        DRIVER_PRIMARY,
+        DRIVER_SECONDARY,
+        DRIVER_CAPABILITIES,
+        DRIVER_BATTERY,
         ]
 
 class ShadeOnlyPrimary(Shade):
     id = 'shadeonlyprimid'
+    positionDrivers = (('GV2', 'primary'),)
 
     drivers = [
-        {'driver': 'GV0', 'value': 0, 'uom': 107, 'name': "Shade Id"},
-        {'driver': 'ST', 'value': 0, 'uom': 2, 'name': "In Motion"}, 
-        {'driver': 'GV1', 'value': 0, 'uom': 107, 'name': "Room Id"},
-        {'driver': 'GV2', 'value': None, 'uom': 100, 'name': "Primary"},
-        {'driver': 'GV5', 'value': 0, 'uom': 25, 'name': "Capabilities"},
-        {'driver': 'GV6', 'value': 0, 'uom': 25, 'name': "Battery Status"},
+        DRIVER_SHADE_ID,
+        DRIVER_MOTION,
+        DRIVER_ROOM_ID,
+        DRIVER_PRIMARY,
+        DRIVER_CAPABILITIES,
+        DRIVER_BATTERY,
         ]
 
 class ShadeOnlySecondary(Shade):
     id = 'shadeonlysecondid'
+    positionDrivers = (('GV3', 'secondary'),)
 
     drivers = [
-            {'driver': 'GV0', 'value': 0, 'uom': 107, 'name': "Shade Id"},
-            {'driver': 'ST', 'value': 0, 'uom': 2, 'name': "In Motion"}, 
-            {'driver': 'GV1', 'value': 0, 'uom': 107, 'name': "Room Id"},
-            {'driver': 'GV3', 'value': None, 'uom': 100, 'name': "Secondary"},
-            {'driver': 'GV5', 'value': 0, 'uom': 25, 'name': "Capabilities"},
-            {'driver': 'GV6', 'value': 0, 'uom': 25, 'name': "Battery Status"},
-            ]
+        DRIVER_SHADE_ID,
+        DRIVER_MOTION,
+        DRIVER_ROOM_ID,
+        DRIVER_SECONDARY,
+        DRIVER_CAPABILITIES,
+        DRIVER_BATTERY,
+        ]
 
 class ShadeNoSecondary(Shade):
     id = 'shadenosecondid'
+    positionDrivers = (('GV2', 'primary'), ('GV4', 'tilt'))
 
     drivers = [
-        {'driver': 'GV0', 'value': 0, 'uom': 107, 'name': "Shade Id"},
-        {'driver': 'ST', 'value': 0, 'uom': 2, 'name': "In Motion"}, 
-        {'driver': 'GV1', 'value': 0, 'uom': 107, 'name': "Room Id"},
-        {'driver': 'GV2', 'value': None, 'uom': 100, 'name': "Primary"},
-        {'driver': 'GV4', 'value': None, 'uom': 100, 'name': "Tilt"},
-        {'driver': 'GV5', 'value': 0, 'uom': 25, 'name': "Capabilities"},
-        {'driver': 'GV6', 'value': 0, 'uom': 25, 'name': "Battery Status"},
+        DRIVER_SHADE_ID,
+        DRIVER_MOTION,
+        DRIVER_ROOM_ID,
+        DRIVER_PRIMARY,
+        DRIVER_TILT,
+        DRIVER_CAPABILITIES,
+        DRIVER_BATTERY,
         ]
 
 class ShadeOnlyTilt(Shade):
     id = 'shadeonlytiltid'
+    positionDrivers = (('GV4', 'tilt'),)
 
     drivers = [
-        {'driver': 'GV0', 'value': 0, 'uom': 107, 'name': "Shade Id"},
-        {'driver': 'ST', 'value': 0, 'uom': 2, 'name': "In Motion"}, 
-        {'driver': 'GV1', 'value': 0, 'uom': 107, 'name': "Room Id"},
-        {'driver': 'GV4', 'value': None, 'uom': 100, 'name': "Tilt"},
-        {'driver': 'GV5', 'value': 0, 'uom': 25, 'name': "Capabilities"},
-        {'driver': 'GV6', 'value': 0, 'uom': 25, 'name': "Battery Status"},
+        DRIVER_SHADE_ID,
+        DRIVER_MOTION,
+        DRIVER_ROOM_ID,
+        DRIVER_TILT,
+        DRIVER_CAPABILITIES,
+        DRIVER_BATTERY,
         ]
     
     """